@@ -9,55 +9,93 @@ Design Pattern:
     - Orchestrator Pattern: The root agent acts as a coordinator that delegates specialized
       tasks to sub-agents while maintaining control over the overall workflow.
     - Human-in-the-Loop: Implements an approval gate before final deployment to ensure
-      quality and compliance.
+      quality and compliance. The gate is asynchronous: the email is snapshotted and the
+      reviewer decides via approve/reject links (see basic/approvals.py), so the agent
+      does not hold its turn open while waiting for a human.
 
 Behavior:
     1. Triggers the email creation pipeline (initial_email_creator_agent)
-    2. Presents results to human for review (safety_report + governed_email)
-    3. Executes deployment or rejection based on human decision
+    2. Presents results to human for review (safety_report + governed_email) and
+       hands off an approval request with approve/reject links
+    3. Executes deployment or rejection based on human decision (via the links, or
+       through the same approval id if the human answers in the conversation)
 """
 
+# Standard library imports
+import logging
+import os
+
 # Third-party imports
 from google.adk.agents import Agent
-from google.adk.models.google_llm import Gemini
 
 # Local imports
-from basic.sub_agents import  initial_email_creator_agent, retry_config
-from basic.tools import deploy_email_to_sfmc_tool, reject_email_tool 
+from basic.approvals import get_approval_tools
+from basic.sub_agents import  initial_email_creator_agent, gemini_model
+from basic.tools import get_tools
 from google.adk.tools.agent_tool import AgentTool
 
+# Logging Configuration
+# Design: Modules log through logging.getLogger(__name__) instead of print, so nothing
+# is written to stdout on the hot path unless explicitly enabled
+# Implementation: Configured once here, at the agent entry point; LOG_LEVEL=DEBUG shows
+# the per-module debug messages (no-op if the host already configured logging)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 
 # Root Orchestrator Agent
 # Design: This agent serves as the entry point and workflow coordinator for the entire
 # email generation system. It maintains a high-level view of the process and delegates
 # specialized tasks to sub-agents.
 #
-# Implementation: Uses Gemini 2.5 Flash Lite model with retry configuration for reliability.
+# Implementation: Uses the shared Gemini 2.5 Flash Lite model (with retry configuration for
+# reliability) so the root agent reuses the same client as the pipeline agents.
 # The AgentTool wrapper allows the SequentialAgent (initial_email_creator_agent) to be
 # invoked as a tool, enabling the root agent to trigger the entire email creation pipeline.
 #
 # Behavior Flow:
 #   1. Receives user request/context
 #   2. Invokes initial_email_creator_agent (via AgentTool) which runs the full pipeline:
-#      - Copy generation → Brand governance → Safety check → Packaging
+#      - Copy generation → Brand governance + Safety check (single structured call)
 #   3. Receives packaged output containing governed_email and safety_report
-#   4. Displays results to human and requests approval
-#   5. Based on approval:
-#      - APPROVE: Calls deploy_email_to_sfmc_tool to send email to SFMC
-#      - REJECT: Calls reject_email_tool to mark email as rejected
+#   4. Calls get_approval_tools().request_human_approval, which persists a snapshot and
+#      notifies the reviewer, then displays results and the approve/reject links and ends
+#      its turn. Clicking a link applies the decision without involving the agent again
+#   5. If the human instead answers in the conversation, the decision goes through the
+#      approval id, so it cannot also be applied by a link (and vice versa):
+#      - APPROVE: Calls get_approval_tools().approve_email, which claims the snapshot and
+#        starts the SFMC deployment of the stored governed_email in the background,
+#        returning a pending_deploy_id immediately; the human can ask for an update
+#        later, answered via get_tools().check_sfmc_deploy_status
+#      - REJECT: Calls get_approval_tools().reject_email_via_approval, which claims the
+#        snapshot and marks the email as rejected
 root_agent = Agent(
     name="RootAgent",
-    model=Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config),
+    model=gemini_model,
     instruction="""
     You need to run the initial_email_creator_agent.
-    Once completed show the safety_report and the governed_email to the human and ask for approval to send to SFMC. 
-    If the human approves, you need to deploy the email to SFMC using the deploy_email_to_sfmc_tool. 
-    If the human rejects, you need to reject the email using the reject_email_tool.
+    Once completed call the request_human_approval tool. It takes no arguments: it reads the generated email and safety report from the session.
+    Show the safety_report, the governed_email and the approve_url / reject_url links to the human, and tell them they can approve or reject by opening a link or by replying here. Do not wait for the decision.
+    If the human approves in this conversation, call the approve_email tool with the approval_id, then tell the human the pending_deploy_id right away without waiting for the deployment to finish.
+    If the human rejects in this conversation, call the reject_email_via_approval tool with the approval_id.
+    If either tool returns an error (for example the email was already approved or rejected through a link), tell the human and do nothing else.
+    If the human asks about a deployment, use the check_sfmc_deploy_status tool with its pending_deploy_id.
     """,
     # Tools available to the root agent:
     # - AgentTool(initial_email_creator_agent): Wraps the sequential pipeline as a callable tool
-    # - reject_email_tool: Marks email as rejected when human disapproves
-    # - deploy_email_to_sfmc_tool: Deploys approved email to Salesforce Marketing Cloud
-    tools=[AgentTool(initial_email_creator_agent), reject_email_tool, deploy_email_to_sfmc_tool],
+    # - get_approval_tools().request_human_approval: Snapshots the email and sends
+    #   approve/reject links
+    # - get_approval_tools().approve_email: Claims the approval and starts deployment of
+    #   the stored email to Salesforce Marketing Cloud without blocking the agent
+    # - get_approval_tools().reject_email_via_approval: Claims the approval and marks the
+    #   email rejected
+    # - get_tools().check_sfmc_deploy_status: Polls the status of an enqueued deployment
+    # The plain reject/enqueue tools are deliberately not exposed here: they bypass the
+    # approval claim and would let one email be decided twice
+    tools=[
+        AgentTool(initial_email_creator_agent),
+        get_approval_tools().request_human_approval,
+        get_approval_tools().approve_email,
+        get_approval_tools().reject_email_via_approval,
+        get_tools().check_sfmc_deploy_status,
+    ],
     
 )
\ No newline at end of file
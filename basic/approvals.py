@@ -0,0 +1,389 @@
+"""
+Asynchronous Human Approval Module
+
+This module implements the human-in-the-loop approval gate as a snapshot/resume
+primitive instead of a blocking wait inside the root agent's conversation turn.
+
+Design Pattern:
+    - Snapshot/Resume: The email under review is persisted together with its session
+      id, the reviewer is notified, and the agent returns immediately
+    - Stateless Hand-off: The decision is applied by an HTTP endpoint that looks up the
+      snapshot and calls the deploy/reject logic directly; the agent never resumes
+    - Single Decision: Every decision path (link or conversation) claims the snapshot
+      atomically and acts on the stored governed_email, so an email can only be
+      approved or rejected once
+    - Unguessable, Prefetch-Safe Links: Approval ids carry 128 random bits, and the
+      links only show a confirmation page; the decision is applied by a POST, so link
+      unfurlers and mail-scanner prefetches cannot approve or reject an email
+    - Configuration via Environment: Store location, public base URL and notification
+      webhook are configurable
+
+Behavior:
+    - request_human_approval: Persists the snapshot, posts approve/reject links to the
+      configured webhook (e.g. Slack) and returns them to the agent
+    - approve_email / reject_email_via_approval: Apply a decision given in the
+      conversation through the same approval id
+    - get_approval_tools(): FunctionTool wrappers for the three tools above, built once
+      on first call (the approval endpoint never needs them)
+    - approval_app: FastAPI app serving /approve/{approval_id} and /reject/{approval_id}
+      (GET shows a confirmation page, POST applies the decision)
+      Run with: uvicorn basic.approvals:approval_app --port 8080
+"""
+
+# Standard library imports
+import asyncio
+import html
+import logging
+import os
+import secrets
+import sqlite3
+import urllib.request
+from contextlib import closing
+from functools import cache
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Tuple
+
+# Third-party imports
+import orjson
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import HTMLResponse
+from google.adk.tools.function_tool import FunctionTool
+from google.adk.tools.tool_context import ToolContext
+
+# Local imports
+from basic.cache import CACHE_KEY_STATE, evict_cached
+from basic.tools import enqueue_sfmc_deploy, reject_email_tool
+
+# Path to the SQLite file holding approval snapshots
+APPROVALS_DB_PATH = os.getenv("APPROVALS_DB_PATH", ".approvals.sqlite3")
+
+# Public base URL of the approval endpoint, used to build the approve/reject links
+APPROVAL_BASE_URL = os.getenv("APPROVAL_BASE_URL", "http://localhost:8080").rstrip("/")
+
+# Incoming webhook (e.g. Slack) notified of new approval requests; unset disables it
+APPROVAL_WEBHOOK_URL = os.getenv("APPROVAL_WEBHOOK_URL")
+
+# Reason reported by _claim_decision for an approval id that was never issued
+_UNKNOWN_APPROVAL = "Unknown approval id"
+
+logger = logging.getLogger(__name__)
+
+
+def _connect() -> sqlite3.Connection:
+    """Opens the approvals database, creating the snapshot table if needed."""
+    conn = sqlite3.connect(APPROVALS_DB_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS approvals ("
+        "id TEXT PRIMARY KEY, session_id TEXT, status TEXT NOT NULL, snapshot TEXT NOT NULL)"
+    )
+    return conn
+
+
+def _save_snapshot(approval_id: str, session_id: Optional[str], snapshot: Dict[str, Any]) -> None:
+    """Persists a pending approval snapshot."""
+    with closing(_connect()) as conn, conn:
+        conn.execute(
+            "INSERT INTO approvals (id, session_id, status, snapshot) VALUES (?, ?, 'pending', ?)",
+            (approval_id, session_id, orjson.dumps(snapshot)),
+        )
+
+
+def _load_snapshot(approval_id: str) -> Optional[Dict[str, Any]]:
+    """Returns the snapshot and status for an approval id, or None if unknown."""
+    with closing(_connect()) as conn, conn:
+        row = conn.execute(
+            "SELECT session_id, status, snapshot FROM approvals WHERE id = ?", (approval_id,)
+        ).fetchone()
+    if row is None:
+        return None
+    return {"session_id": row[0], "status": row[1], **orjson.loads(row[2])}
+
+
+def _claim_snapshot(approval_id: str, status: str) -> bool:
+    """
+    Atomically moves a pending approval to its final status.
+
+    Returns:
+        True if this call made the transition, False if it was already decided
+    """
+    with closing(_connect()) as conn, conn:
+        cursor = conn.execute(
+            "UPDATE approvals SET status = ? WHERE id = ? AND status = 'pending'",
+            (status, approval_id),
+        )
+    return cursor.rowcount == 1
+
+
+def _notify(message: str) -> None:
+    """Posts a message to the approval webhook; failures are logged, not raised."""
+    if not APPROVAL_WEBHOOK_URL:
+        return
+    request = urllib.request.Request(
+        APPROVAL_WEBHOOK_URL,
+        data=orjson.dumps({"text": message}),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        urllib.request.urlopen(request, timeout=10).close()
+    except OSError as e:
+        logger.warning("Approval notification failed: %s", e)
+
+
+async def request_human_approval(tool_context: ToolContext) -> dict:
+    """
+    Hands the generated email off to a human reviewer without waiting for a decision.
+
+    Design: Waiting for a human inside an agent turn ties up the session and model
+    context for as long as the reviewer takes. Instead the email is snapshotted, the
+    reviewer gets approve/reject links, and the agent finishes its turn.
+
+    Implementation: The governed_email and safety_report are read from session state
+    (written by the pipeline and forwarded to the root session by AgentTool), not taken
+    as tool arguments, so the root model cannot paraphrase, truncate or misquote the
+    email or its re-checked safety report before it is approved and deployed.
+
+    Behavior:
+        1. Persists {governed_email, safety_report, session_id} under a new approval id,
+           together with the pipeline cache key so a rejection can evict the email.
+           Returns an error instead if the pipeline has not produced an email yet
+        2. Posts the approve/reject links to APPROVAL_WEBHOOK_URL (if configured)
+        3. Returns the links immediately; the decision is applied by approval_app
+
+    Args:
+        tool_context: Injected by ADK; provides the session state and session id
+
+    Returns:
+        Dictionary with the approval handle:
+        {
+            "approval_id": str,
+            "approve_url": str,
+            "reject_url": str,
+            "requires_confirmation": True   # Decision happens outside this conversation
+        }
+        or {"status": "error", "note": str} if there is no email to approve
+    """
+    governed_email = tool_context.state.get("governed_email")
+    safety_report = tool_context.state.get("safety_report")
+    if governed_email is None or safety_report is None:
+        return {"status": "error", "note": "No generated email in session state; run the email pipeline first."}
+    # The id is the only secret in the approve/reject links, so it carries 128 random bits
+    approval_id = "appr_" + secrets.token_urlsafe(16)
+    approve_url = f"{APPROVAL_BASE_URL}/approve/{approval_id}"
+    reject_url = f"{APPROVAL_BASE_URL}/reject/{approval_id}"
+    snapshot = {
+        "governed_email": governed_email,
+        "safety_report": safety_report,
+        "cache_key": tool_context.state.get(CACHE_KEY_STATE),
+    }
+    await asyncio.to_thread(_save_snapshot, approval_id, tool_context.session.id, snapshot)
+    await asyncio.to_thread(
+        _notify,
+        f"Email {approval_id} is awaiting approval.\nApprove: {approve_url}\nReject: {reject_url}",
+    )
+    return {
+        "approval_id": approval_id,
+        "approve_url": approve_url,
+        "reject_url": reject_url,
+        "requires_confirmation": True,
+    }
+
+
+async def _claim_decision(approval_id: str, status: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Claims a pending approval for a decision, shared by the link and conversation paths.
+    
+    Args:
+        approval_id: Id returned by request_human_approval
+        status: "approved" or "rejected"
+    
+    Returns:
+        (snapshot, None) if this call made the decision, or (None, reason) if the id is
+        unknown or the approval was already decided
+    """
+    snapshot = await asyncio.to_thread(_load_snapshot, approval_id)
+    if snapshot is None:
+        return None, _UNKNOWN_APPROVAL
+    if not await asyncio.to_thread(_claim_snapshot, approval_id, status):
+        current = await asyncio.to_thread(_load_snapshot, approval_id)
+        return None, f"Already {current['status']}"
+    return snapshot, None
+
+
+async def _approve_snapshot(snapshot: Dict[str, Any]) -> str:
+    """
+    Enqueues the SFMC deployment of an approved snapshot, shared by the link and
+    conversation paths.
+    
+    Implementation: Uses enqueue_sfmc_deploy, so every approval gets the background
+    worker's retries/backoff and can be followed with check_sfmc_deploy_status (in the
+    process that applied the decision).
+    
+    Returns:
+        The pending_deploy_id of the enqueued deployment
+    """
+    deployment = await enqueue_sfmc_deploy(snapshot["governed_email"])
+    return deployment["pending_deploy_id"]
+
+
+async def _reject_snapshot(snapshot: Dict[str, Any]) -> str:
+    """Records a rejection and evicts the rejected email from the pipeline cache."""
+    if snapshot.get("cache_key"):
+        await asyncio.to_thread(evict_cached, snapshot["cache_key"])
+    return reject_email_tool()
+
+
+async def approve_email(approval_id: str) -> dict:
+    """
+    Applies an approval given in the conversation.
+    
+    Design: Goes through the same snapshot claim as the approve link, so an email
+    approved or rejected by link cannot also be decided here (and vice versa), and the
+    stored governed_email is deployed rather than the agent's copy of it.
+    
+    Args:
+        approval_id: Id returned by request_human_approval
+    
+    Returns:
+        {"approval_id", "status": "approved", "pending_deploy_id"} once the deployment
+        is enqueued, or {"approval_id", "status": "error", "note"} if the approval was
+        unknown or already decided
+    """
+    snapshot, error = await _claim_decision(approval_id, "approved")
+    if snapshot is None:
+        return {"approval_id": approval_id, "status": "error", "note": error}
+    return {"approval_id": approval_id, "status": "approved", "pending_deploy_id": await _approve_snapshot(snapshot)}
+
+
+async def reject_email_via_approval(approval_id: str) -> dict:
+    """
+    Applies a rejection given in the conversation.
+    
+    Design: Goes through the same snapshot claim as the reject link (see approve_email).
+    
+    Args:
+        approval_id: Id returned by request_human_approval
+    
+    Returns:
+        {"approval_id", "status": "rejected", "note"}, or {"approval_id", "status":
+        "error", "note"} if the approval was unknown or already decided
+    """
+    snapshot, error = await _claim_decision(approval_id, "rejected")
+    if snapshot is None:
+        return {"approval_id": approval_id, "status": "error", "note": error}
+    return {"approval_id": approval_id, "status": "rejected", "note": await _reject_snapshot(snapshot)}
+
+
+@cache
+def get_approval_tools() -> SimpleNamespace:
+    """
+    Returns the FunctionTool wrappers for the approval tools, building them on first call.
+    
+    Design: Mirrors basic.tools.get_tools(), so every tool in the system is obtained
+    the same way and each wrapper is built once.
+    
+    Returns:
+        Namespace with request_human_approval, approve_email and
+        reject_email_via_approval FunctionTools
+    """
+    return SimpleNamespace(
+        request_human_approval=FunctionTool(request_human_approval),
+        approve_email=FunctionTool(approve_email),
+        reject_email_via_approval=FunctionTool(reject_email_via_approval),
+    )
+
+
+# Approval Endpoint
+# Design: Applies the human decision out of band; no agent session is resumed
+# Behavior:
+#   - GET /approve/{id}, GET /reject/{id}: confirmation page only, so prefetching the
+#     link (Slack unfurls, mail scanners) has no effect
+#   - POST /approve/{id}: enqueues the SFMC deployment of the snapshotted governed_email
+#     (same helper as the conversation path) and returns its pending_deploy_id
+#   - POST /reject/{id}: records the rejection
+#   - Each approval can be decided once (by link or in the conversation); repeated
+#     decisions return 409
+approval_app = FastAPI(title="Email Approval")
+
+
+def _render_review(snapshot: Dict[str, Any]) -> str:
+    """
+    Renders the snapshotted email and its safety report as escaped HTML.
+    
+    Design: The link reviewer decides on this page alone, so it shows everything the
+    chat reviewer sees: every subject line, every full body variant (including the
+    appended disclaimer) and the safety report. An unsafe report is shown as a warning
+    banner above the email.
+    """
+    email = snapshot.get("governed_email") or {}
+    report = snapshot.get("safety_report") or {}
+    parts = []
+    if not report.get("safe"):
+        issues = []
+        if report.get("pii_detected"):
+            issues.append("PII detected")
+        if report.get("spam_hits"):
+            issues.append("spam triggers: " + ", ".join(report["spam_hits"]))
+        parts.append(
+            '<p style="background:#fdd;border:2px solid #c00;padding:8px">'
+            "<strong>WARNING: this email failed the safety check"
+            + (" (" + html.escape("; ".join(issues)) + ")" if issues else "")
+            + ".</strong></p>"
+        )
+    parts.append("<h2>Subject lines</h2><ul>")
+    parts.extend(f"<li>{html.escape(subject)}</li>" for subject in email.get("subject_lines", []))
+    parts.append("</ul><h2>Body variants</h2>")
+    parts.extend(
+        f'<pre style="white-space:pre-wrap">{html.escape(body)}</pre>' for body in email.get("body_variants", [])
+    )
+    parts.append(
+        "<h2>Safety report</h2><ul>"
+        f"<li>safe: {html.escape(str(report.get('safe')))}</li>"
+        f"<li>pii_detected: {html.escape(str(report.get('pii_detected')))}</li>"
+        f"<li>spam_hits: {html.escape(', '.join(report.get('spam_hits') or []) or 'none')}</li>"
+        "</ul>"
+    )
+    return "".join(parts)
+
+
+async def _confirmation_page(approval_id: str, action: str) -> HTMLResponse:
+    """Renders the page whose button POSTs the decision back to the same URL."""
+    snapshot = await asyncio.to_thread(_load_snapshot, approval_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail=_UNKNOWN_APPROVAL)
+    if snapshot["status"] != "pending":
+        raise HTTPException(status_code=409, detail=f"Already {snapshot['status']}")
+    return HTMLResponse(
+        f"<h1>{action.capitalize()} email {html.escape(approval_id)}?</h1>"
+        + _render_review(snapshot)
+        + f'<form method="post"><button type="submit">{action.capitalize()}</button></form>'
+    )
+
+
+@approval_app.get("/approve/{approval_id}", response_class=HTMLResponse)
+async def confirm_approve(approval_id: str) -> HTMLResponse:
+    """Shows the approval confirmation page."""
+    return await _confirmation_page(approval_id, "approve")
+
+
+@approval_app.get("/reject/{approval_id}", response_class=HTMLResponse)
+async def confirm_reject(approval_id: str) -> HTMLResponse:
+    """Shows the rejection confirmation page."""
+    return await _confirmation_page(approval_id, "reject")
+
+
+@approval_app.post("/approve/{approval_id}")
+async def approve(approval_id: str) -> dict:
+    """Enqueues the SFMC deployment of the snapshotted email."""
+    snapshot, error = await _claim_decision(approval_id, "approved")
+    if snapshot is None:
+        raise HTTPException(status_code=404 if error == _UNKNOWN_APPROVAL else 409, detail=error)
+    return {"approval_id": approval_id, "status": "approved", "pending_deploy_id": await _approve_snapshot(snapshot)}
+
+
+@approval_app.post("/reject/{approval_id}")
+async def reject(approval_id: str) -> dict:
+    """Records the rejection of the snapshotted email and evicts it from the pipeline cache."""
+    snapshot, error = await _claim_decision(approval_id, "rejected")
+    if snapshot is None:
+        raise HTTPException(status_code=404 if error == _UNKNOWN_APPROVAL else 409, detail=error)
+    return {"approval_id": approval_id, "status": "rejected", "note": await _reject_snapshot(snapshot)}
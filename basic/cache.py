@@ -0,0 +1,183 @@
+"""
+Pipeline Result Cache Module
+
+This module caches the packaged output of the email pipeline, keyed by a content hash
+of its inputs, so re-running the pipeline on an unchanged campaign brief, unchanged
+creative guidelines and an unchanged request from the root agent skips every LLM call.
+
+Design Pattern:
+    - Content-Addressed Cache: The key is a hash of everything that determines the
+      output (brief, guidelines, the root agent's request, model, pipeline version), so
+      a revision request ("make it shorter") is a different key, and no explicit
+      invalidation is needed beyond bumping PIPELINE_VERSION when prompts or schemas
+      change
+    - Evict on Rejection: The key of each run is kept in session state
+      (CACHE_KEY_STATE); rejecting the email evicts it, so retrying after a rejection
+      generates a new draft instead of serving the rejected one again
+    - Callback Pattern: Lookup runs as a before_agent_callback (returning content skips
+      the pipeline) and storage runs as an after_agent_callback
+    - Configuration via Environment: The SQLite file location is configurable
+
+Behavior:
+    - On a hit, restores governed_email, safety_report and packaged into session state
+      and returns the packaged JSON as the pipeline result
+    - On a miss, lets the pipeline run and stores its packaged output afterwards
+    - evict_cached removes an entry (used by the rejection paths)
+"""
+
+# Standard library imports
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+from contextlib import closing
+from typing import Any, Dict, Optional
+
+# Third-party imports
+import orjson
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+
+# Bump whenever prompts, schemas or pipeline structure change so stale results are
+# never served for the new pipeline
+PIPELINE_VERSION = 1
+
+# Path to the SQLite cache file
+# Implementation: Overridable via PIPELINE_CACHE_PATH for environments where the
+# working directory is not writable
+CACHE_PATH = os.getenv("PIPELINE_CACHE_PATH", ".pipeline_cache.sqlite3")
+
+# Session state key holding the cache key of the most recent pipeline run
+CACHE_KEY_STATE = "pipeline_cache_key"
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(campaign_brief: Any, creative_guidelines: Any, request: str, model: str) -> str:
+    """
+    Computes the content hash identifying a pipeline result.
+
+    Args:
+        campaign_brief: The campaign brief from session state
+        creative_guidelines: The creative guidelines from session state
+        request: Text of the request that invoked the pipeline (the AgentTool call
+                 from the root agent, e.g. a revision instruction)
+        model: Name of the model used by the pipeline agents
+
+    Returns:
+        Hex digest that changes whenever any input to the pipeline changes
+    """
+    payload = orjson.dumps(
+        {
+            "brief": campaign_brief,
+            "guidelines": creative_guidelines,
+            "request": request,
+            "model": model,
+            "pipeline_version": PIPELINE_VERSION,
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    """Opens the cache database, creating the results table if needed."""
+    conn = sqlite3.connect(CACHE_PATH)
+    conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    return conn
+
+
+def get_cached(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Looks up a cached pipeline result.
+
+    Args:
+        key: Cache key from cache_key()
+
+    Returns:
+        The cached packaged result, or None on a miss
+    """
+    with closing(_connect()) as conn, conn:
+        row = conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+    return orjson.loads(row[0]) if row else None
+
+
+def put_cached(key: str, value: Dict[str, Any]) -> None:
+    """
+    Stores a pipeline result, replacing any previous entry for the key.
+
+    Args:
+        key: Cache key from cache_key()
+        value: The packaged result to store
+    """
+    with closing(_connect()) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+            (key, orjson.dumps(value)),
+        )
+
+
+def evict_cached(key: str) -> None:
+    """
+    Removes a pipeline result from the cache, if present.
+    
+    Args:
+        key: Cache key from cache_key()
+    """
+    with closing(_connect()) as conn, conn:
+        conn.execute("DELETE FROM results WHERE key = ?", (key,))
+
+
+def cached_pipeline_callbacks(model: str):
+    """
+    Builds the lookup/store callback pair for the email pipeline.
+
+    Design: The model name is part of the cache key, so the callbacks are built for a
+    specific model rather than reading it from the agent tree at run time. The key of
+    each run is recorded under CACHE_KEY_STATE so the rejection paths can evict it.
+
+    Args:
+        model: Name of the model used by the pipeline agents
+
+    Returns:
+        (before_agent_callback, after_agent_callback) tuple. The before callback must
+        run after the campaign data has been loaded into state.
+    """
+
+    def _key(callback_context: CallbackContext) -> str:
+        user_content = callback_context.user_content
+        request = "".join(
+            part.text or "" for part in (user_content.parts or [])
+        ) if user_content else ""
+        return cache_key(
+            callback_context.state.get('campaign_brief'),
+            callback_context.state.get('creative_guidelines'),
+            request,
+            model,
+        )
+
+    async def lookup_cached_email(callback_context: CallbackContext) -> Optional[types.Content]:
+        """Serves the packaged result from cache, skipping the pipeline on a hit."""
+        key = _key(callback_context)
+        callback_context.state[CACHE_KEY_STATE] = key
+        # SQLite is blocking I/O, so keep it off the event loop
+        packaged = await asyncio.to_thread(get_cached, key)
+        if packaged is None:
+            return None
+        logger.debug("Pipeline cache hit key=%s", key)
+        callback_context.state['governed_email'] = packaged.get('governed_email')
+        callback_context.state['safety_report'] = packaged.get('safety_report')
+        callback_context.state['packaged'] = packaged
+        return types.Content(role="model", parts=[types.Part(text=orjson.dumps(packaged).decode())])
+
+    async def store_cached_email(callback_context: CallbackContext) -> None:
+        """Stores the packaged result produced by a pipeline run."""
+        packaged = callback_context.state.get('packaged')
+        key = callback_context.state.get(CACHE_KEY_STATE)
+        if not key or not packaged or packaged.get('governed_email') is None:
+            return None
+        await asyncio.to_thread(put_cached, key, packaged)
+        return None
+
+    return lookup_cached_email, store_cached_email
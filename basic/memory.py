@@ -11,20 +11,26 @@ Design Pattern:
     - Configuration via Environment: Uses environment variables for file paths
 
 Behavior:
-    - Loads campaign brief and creative guidelines from JSON file
+    - Loads campaign brief and creative guidelines from JSON file once, at import
     - Injects data into session state accessible by all agents in the pipeline
     - Executes before agent instructions are constructed, ensuring data is available
 """
 
 # Standard library imports
-import json
+import logging
 import os
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, Optional
 
 # Third-party imports
+import orjson
 from dotenv import load_dotenv
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.sessions.state import State
+from google.genai import types
+
+# Local imports
+from basic.tools import safety_check
 
 # Load environment variables from .env file
 # This allows configuration of data paths without hardcoding
@@ -34,8 +40,111 @@ load_dotenv()
 # Implementation: Constructs path using DATA_ROOT_FOLDER environment variable
 # This enables flexible deployment across different environments (dev, staging, prod)
 # Falls back to ./data if environment variable is not set
-DATA_ROOT = os.getenv("DATA_ROOT_FOLDER", "./data")
-SAMPLE_SCENARIO_PATH = os.path.join(DATA_ROOT, "initial_state.json")
+# The path is resolved once here; since the file is also read at import, a missing or
+# misconfigured path fails at process start rather than on the first request
+DATA_ROOT = Path(os.getenv("DATA_ROOT_FOLDER", "./data"))
+SAMPLE_SCENARIO_PATH = DATA_ROOT / "initial_state.json"
+
+logger = logging.getLogger(__name__)
+
+
+def _read_initial_state() -> Dict[str, Any]:
+    """
+    Reads and parses the initial state JSON file.
+    
+    Design: The initial state is static configuration, so it is read once at import
+    (see _INITIAL_STATE) rather than on every pipeline invocation.
+    
+    Returns:
+        The parsed contents of initial_state.json
+    """
+    data = orjson.loads(SAMPLE_SCENARIO_PATH.read_bytes())
+    logger.debug("Loaded initial state from %s", SAMPLE_SCENARIO_PATH)
+    return data
+
+
+def _summarize_guidelines(guidelines: Dict[str, Any]) -> str:
+    """
+    Condenses the creative guidelines into a short bulleted list of constraints.
+    
+    Design: The full guidelines document (recommended lengths, alternative disclaimers,
+    personalization flags, scoring weights, JSON punctuation) is re-sent with every
+    prompt that references it. Agents only need the hard constraints, so prompts
+    reference this compact form instead.
+    
+    Implementation: Picks the constraint fields only and renders one bullet per rule:
+    brand, tone, banned phrases, CTA rules, max lengths, the default disclaimer,
+    capitalization/punctuation limits, PII never-include and required elements.
+    Accepts both the detailed schema in data/initial_state.json and the flat schema
+    used by brand_check (tone / banned_phrases / subject_length_limit / disclaimer).
+    
+    Args:
+        guidelines: The creative_guidelines dictionary
+    
+    Returns:
+        Newline-separated bullet list of brand rules
+    """
+    rules = []
+    if guidelines.get("brand"):
+        rules.append(f"Brand: {guidelines['brand']}")
+    tone = guidelines.get("tone")
+    if isinstance(tone, dict):
+        tones = [t for t in (tone.get("primary"), tone.get("secondary")) if t]
+        if tones:
+            rules.append("Tone: " + "; ".join(tones))
+        if tone.get("voice_characteristics"):
+            rules.append("Voice: " + "; ".join(tone["voice_characteristics"]))
+    elif tone:
+        rules.append(f"Tone: {tone}")
+    if guidelines.get("banned_phrases"):
+        rules.append("Never use: " + ", ".join(guidelines["banned_phrases"]))
+    cta_rules = guidelines.get("cta_rules") or {}
+    preferred_ctas = cta_rules.get("preferred_ctas") or guidelines.get("cta_examples")
+    if preferred_ctas:
+        rules.append("Preferred CTAs: " + ", ".join(preferred_ctas))
+    if cta_rules.get("avoid"):
+        rules.append("Avoid CTAs: " + ", ".join(cta_rules["avoid"]))
+    if cta_rules.get("style"):
+        rules.append(f"CTA style: {cta_rules['style']}")
+    limits = guidelines.get("length_limits") or {}
+    subject_max = (limits.get("subject_line") or {}).get("max_chars") or guidelines.get("subject_length_limit")
+    if subject_max:
+        rules.append(f"Subject lines: max {subject_max} chars")
+    body_max = (limits.get("email_body") or {}).get("max_chars")
+    if body_max:
+        rules.append(f"Body: max {body_max} chars")
+    preheader_max = (limits.get("preheader") or {}).get("max_chars")
+    if preheader_max:
+        rules.append(f"Preheader: max {preheader_max} chars")
+    disclaimer = (guidelines.get("disclaimers") or {}).get("default") or guidelines.get("disclaimer")
+    if disclaimer:
+        rules.append(f"Disclaimer to append: {disclaimer}")
+    style = guidelines.get("style_guidelines") or {}
+    caps = style.get("capitalization") or {}
+    if caps.get("avoid_all_caps"):
+        rules.append("No ALL CAPS" + (
+            f" (max {caps['max_caps_percentage']}% capitals)" if caps.get("max_caps_percentage") is not None else ""
+        ))
+    max_exclamation = (style.get("punctuation") or {}).get("max_exclamation_marks")
+    if max_exclamation is not None:
+        rules.append(f"Max {max_exclamation} exclamation mark(s)")
+    compliance = guidelines.get("compliance_rules") or {}
+    never_include = (compliance.get("pii_handling") or {}).get("never_include")
+    if never_include:
+        rules.append("Never include: " + ", ".join(never_include))
+    if compliance.get("required_elements"):
+        rules.append("Must include: " + ", ".join(compliance["required_elements"]))
+    return "\n".join(f"- {rule}" for rule in rules)
+
+
+# Parsed initial state, loaded once per process
+# Implementation: Amortizes the file read + JSON parse across all pipeline runs;
+# the before_agent_callback only copies the needed fields into session state
+_INITIAL_STATE = _read_initial_state()
+
+# Compact brand rules derived from the creative guidelines, computed once per process
+# Referenced by agent prompts as {brand_rules_short} instead of the full document
+_BRAND_RULES_SHORT = _summarize_guidelines(_INITIAL_STATE['creative_guidelines'])
 
 def _set_initial_states(source: Dict[str, Any], target: State | dict[str, Any]):
     """
@@ -54,12 +163,12 @@ def _set_initial_states(source: Dict[str, Any], target: State | dict[str, Any]):
     Behavior:
         - Merges all key-value pairs from source into target
         - Overwrites existing keys if they exist in target
-        - Prints the updated state for debugging purposes
+        - Logs the injected keys (not the values) at debug level
     """
     target.update(source)
-    print(target)
+    logger.debug("Initialized state keys=%s", list(source))
 
-def _load_precreated_brief(callback_context: CallbackContext):
+async def _load_precreated_brief(callback_context: CallbackContext):
     """
     Callback function to initialize session state with campaign data.
     
@@ -68,34 +177,106 @@ def _load_precreated_brief(callback_context: CallbackContext):
     that campaign_brief and creative_guidelines are available in the session state.
     
     Implementation Details:
-        - Reads initial_state.json from the configured data path
-        - Extracts campaign_brief and creative_guidelines from the JSON
+        - Uses the initial state parsed once at import (_INITIAL_STATE)
+        - Extracts campaign_brief and creative_guidelines from it
+        - Adds the pre-summarized brand_rules_short alongside the full guidelines
         - Injects these into callback_context.state for use by all agents
         - Uses selective injection (only specific keys) rather than bulk update
     
     Behavior:
-        1. Opens and parses the initial_state.json file
+        1. Reads the cached initial state (no file I/O per invocation)
         2. Extracts campaign_brief and creative_guidelines fields
-        3. Injects them into the session state dictionary
+        3. Injects them, plus brand_rules_short, into the session state dictionary
         4. All subsequent agents can access these via state variables:
            - {campaign_brief} in agent instructions
            - {creative_guidelines} in agent instructions
+           - {brand_rules_short} in agent instructions (compact bulleted rules)
     
     Args:
         callback_context: The callback context provided by ADK, containing:
             - state: Dictionary-like object for session state storage
             - Other context information about the current agent execution
     
+    Note: Declared async so ADK awaits it on its event loop instead of calling it
+    synchronously. Since the initial state is cached at import, the body is a pure
+    state assignment and never blocks the loop on file I/O.
+    
     Note: The commented-out _set_initial_states call suggests this was previously
     used for bulk state injection, but was replaced with selective field injection
     for better control and clarity.
     """    
-    data = {}
-    with open(SAMPLE_SCENARIO_PATH, "r") as file:
-        data = json.load(file)
-        print(f"\nLoading Initial State: {data}\n")
+    data = _INITIAL_STATE
     # _set_initial_states(data, callback_context.state)
     # Selective state injection: Only inject the fields needed by the agents
     # This approach provides better control and makes dependencies explicit
     callback_context.state['campaign_brief'] = data['campaign_brief']
-    callback_context.state['creative_guidelines'] = data['creative_guidelines']
\ No newline at end of file
+    callback_context.state['creative_guidelines'] = data['creative_guidelines']
+    callback_context.state['brand_rules_short'] = _BRAND_RULES_SHORT
+
+def _unpack_governed_and_checked(callback_context: CallbackContext) -> Optional[types.Content]:
+    """
+    Callback function to split the governance stage output into its state keys.
+    
+    Design: Registered as an after_agent_callback on the GovernedAndCheckedAgent.
+    The agent returns a single schema-validated JSON object; this callback performs
+    the packaging step deterministically instead of spending an LLM call on it.
+    
+    Implementation Details:
+        - Reads the parsed output stored under "governed_and_checked" (ADK validates
+          it against the agent's output_schema and stores it as a dict)
+        - Copies its governed_email field into its own state key
+        - Re-runs safety_check on the final governed_email instead of trusting the
+          safety_report relayed by the model: governance is an LLM rewrite that can add
+          text (including spam triggers or PII) after the tool call, or the model may
+          misquote the tool's result. The check is a single regex pass, so re-running it
+          is as cheap as hashing the email to detect whether it changed
+    
+    Behavior:
+        1. Looks up state["governed_and_checked"]
+        2. Injects governed_email and a freshly computed safety_report into the session
+           state
+        3. If the relayed report matches, returns None so the agent's own JSON output
+           remains the pipeline result; otherwise logs a warning and returns the
+           corrected JSON, which replaces it as the pipeline result
+    
+    Args:
+        callback_context: The callback context provided by ADK
+    """
+    result = callback_context.state.get('governed_and_checked') or {}
+    governed_email = result.get('governed_email')
+    safety_report = result.get('safety_report')
+    corrected = None
+    if governed_email is not None:
+        checked = safety_check(governed_email)
+        if checked != safety_report:
+            logger.warning("Relayed safety_report did not match the governed email; using re-checked report")
+            safety_report = checked
+            result = {'governed_email': governed_email, 'safety_report': safety_report}
+            callback_context.state['governed_and_checked'] = result
+            corrected = types.Content(role="model", parts=[types.Part(text=orjson.dumps(result).decode())])
+    callback_context.state['governed_email'] = governed_email
+    callback_context.state['safety_report'] = safety_report
+    return corrected
+
+
+def _package_email(callback_context: CallbackContext):
+    """
+    Callback function to assemble the final packaged email deliverable.
+    
+    Design: Registered as an after_agent_callback on the email pipeline
+    (SequentialAgent). Packaging is a pure dict merge, so it is done in Python
+    rather than by an LLM: no network call, deterministic output shape, and no
+    risk of the model drifting from the expected schema.
+    
+    Behavior:
+        1. Reads governed_email and safety_report from the session state
+        2. Stores {"governed_email": ..., "safety_report": ...} under "packaged"
+        3. Returns None so the pipeline's final response is left unchanged
+    
+    Args:
+        callback_context: The callback context provided by ADK
+    """
+    callback_context.state['packaged'] = {
+        'governed_email': callback_context.state.get('governed_email'),
+        'safety_report': callback_context.state.get('safety_report'),
+    }
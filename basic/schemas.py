@@ -0,0 +1,54 @@
+"""
+Structured Output Schemas Module
+
+This module defines the pydantic models used as response schemas for agents whose
+output is consumed programmatically rather than read by a human.
+
+Design Pattern:
+    - Schema-Enforced Output: Models are passed to agents via output_schema so Gemini
+      constrains its decoding to valid JSON of the expected shape
+    - Single Source of Truth: The same models document the state keys written by the
+      pipeline (governed_email, safety_report)
+
+Schemas:
+    - CopyOutput: Draft copy produced by the CopyAgent (3 subjects, 2 bodies)
+    - GovernedEmail: Brand-governed subject lines and body variants
+    - SafetyReport: Result of the spam/PII screening (mirrors safety_check's return value)
+    - GovernedAndCheckedEmail: Combined governance + safety result for the pipeline
+"""
+
+# Third-party imports
+from pydantic import BaseModel, Field
+
+
+class CopyOutput(BaseModel):
+    """Draft email copy: three subject line options and two body variants."""
+
+    subject_lines: list[str] = Field(
+        min_length=3, max_length=3, description="Exactly 3 subject line options"
+    )
+    body_variants: list[str] = Field(
+        min_length=2, max_length=2, description="Exactly 2 body variants"
+    )
+
+
+class GovernedEmail(BaseModel):
+    """Email content after brand/style guidelines have been applied."""
+
+    subject_lines: list[str] = Field(description="Governed subject line options")
+    body_variants: list[str] = Field(description="Governed body variants")
+
+
+class SafetyReport(BaseModel):
+    """Spam and PII screening result as returned by the safety_check tool."""
+
+    safe: bool = Field(description="True if the email passes all checks")
+    spam_hits: list[str] = Field(description="Detected spam trigger words")
+    pii_detected: bool = Field(description="True if PII patterns were found")
+
+
+class GovernedAndCheckedEmail(BaseModel):
+    """Combined output of the governance stage: governed email plus its safety report."""
+
+    governed_email: GovernedEmail
+    safety_report: SafetyReport
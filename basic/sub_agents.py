@@ -7,17 +7,18 @@ specific task and passes its output to the next agent.
 
 Architecture:
     - Pipeline Pattern: Agents execute in sequence, each building upon previous output
-    - Single Responsibility: Each agent has one clear purpose (copy, brand, safety, packaging)
+    - Minimal Round-Trips: Governance, safety and packaging share one LLM call
+    - Structured Output: Machine-consumed output is constrained by pydantic schemas
     - State-Based Communication: Agents communicate via shared state keys (output_key)
 
 Pipeline Flow:
     1. CopyAgent: Generates initial email content (subjects + body variants)
-    2. BrandAgent: Applies brand guidelines and governance rules
-    3. SafetyAgent: Performs compliance and safety checks
-    4. PackagingAgent: Combines outputs into final deliverable format
+    2. GovernedAndCheckedAgent: Applies brand guidelines, runs the safety check and
+       returns the packaged governed_email + safety_report JSON
 """
 
 # Standard library imports
+import logging
 import os
 
 # Third-party imports
@@ -26,15 +27,22 @@ from google.adk.models.google_llm import Gemini
 from google.genai import types
 
 # Local imports
-from basic.tools import safety_check_tool
-from basic.memory import _load_precreated_brief
+from basic.cache import cached_pipeline_callbacks
+from basic.tools import get_tools
+from basic.memory import _load_precreated_brief, _package_email, _unpack_governed_and_checked
+from basic.schemas import CopyOutput, GovernedAndCheckedEmail
+
+logger = logging.getLogger(__name__)
 
 # Retry Configuration
 # Design: Implements exponential backoff retry strategy for API reliability
 # Implementation: Configures HTTP retry behavior for Gemini API calls
 # Behavior:
 #   - Attempts up to 5 retries on transient failures
-#   - Uses exponential backoff with base 7 (delays: 1s, 7s, 49s, 343s, 2401s)
+#   - Uses exponential backoff with base 2 (delays: 0.5s, 1s, 2s, 4s, capped at 8s),
+#     so the worst-case sleep for one call is ~15s instead of minutes
+#   - Adds random jitter to each delay so concurrent calls hitting the same rate limit
+#     do not retry in lockstep
 #   - Only retries on specific HTTP status codes indicating transient errors:
 #     * 429: Rate limiting (too many requests)
 #     * 500: Internal server error
@@ -43,132 +51,125 @@ from basic.memory import _load_precreated_brief
 # This ensures resilience against temporary API issues without overwhelming the service
 retry_config=types.HttpRetryOptions(
     attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier for exponential backoff
-    initial_delay=1,  # Initial delay in seconds before first retry
+    exp_base=2,  # Delay multiplier for exponential backoff
+    initial_delay=0.5,  # Initial delay in seconds before first retry
+    max_delay=8,  # Upper bound in seconds for any single delay
+    jitter=0.5,  # Random extra delay (seconds) added to spread out retries
     http_status_codes=[429, 500, 503, 504], # Retry on these HTTP errors
 )
 
+# Shared Gemini Model
+# Design: One model instance shared by every agent in the system
+# Implementation: Gemini lazily creates its google.genai client (HTTP client + auth
+# credential chain) per instance, so constructing one per agent meant one connection
+# pool per agent. Passing the same instance to all agents lets every stage reuse the
+# same client and its pooled TCP/TLS connections
+gemini_model = Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config)
+
 # 1) Copy Agent — LLM writes 3 subjects + 2 body variants in strict JSON
 # Design: First stage of the pipeline, responsible for creative content generation
 # Implementation: Uses LLM to generate multiple variants for A/B testing opportunities
 # Behavior:
-#   - Reads campaign_brief and creative_guidelines from session state
+#   - Reads campaign_brief and brand_rules_short (compact creative guidelines) from state
 #   - Generates 3 subject line options (for testing different approaches)
 #   - Generates 2 body variants (for personalization or testing)
-#   - Outputs structured JSON to ensure downstream agents can parse reliably
+#   - Outputs structured JSON to ensure downstream agents can parse reliably.
+#     output_schema=CopyOutput makes Gemini decode in JSON mode against the schema, so
+#     the draft is always parseable on the first try (no prose or code fences)
 #   - Stores output in state under "draft_email" key for next agent
 copy_agent = Agent(
     name="CopyAgent",
-    model=Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config),
+    model=gemini_model,
     instruction="""
 You are an email copywriter. You are given a campaign brief and you need to write 3 subject lines and 2 body variants following the creative guidelines.
 Campaign brief: {campaign_brief}
-Creative guidelines: {creative_guidelines}
+Creative guidelines:
+{brand_rules_short}
 
-Return a STRICT JSON with keys:
-{
-  "subject_lines": ["...", "...", "..."],
-  "body_variants": ["...", "..."]
-}
+Return the subject_lines and body_variants as JSON.
 """,
-    # State injection mechanism: The {campaign_brief} and {creative_guidelines} placeholders
+    # State injection mechanism: The {campaign_brief} and {brand_rules_short} placeholders
     # are automatically replaced with values from callback_context.state when the agent runs.
     # The output_key specifies where this agent's result will be stored in state.
+    output_schema=CopyOutput,
     output_key="draft_email",
 )
 
-# 2) Brand/Style Agent — post-process via FunctionTool
-# Design: Governance layer that ensures brand compliance and style consistency
-# Implementation: Uses LLM to review and modify draft content according to guidelines
+# 2) Governed-and-Checked Agent — brand governance + safety check in one LLM call
+# Design: Fuses the former Brand, Safety and Packaging stages. All three operated on
+# ~the same text, so running them as separate agents paid three model round-trips
+# (and shipped the system prompt and guidelines three times) for one logical step
+# Implementation: A single LLM call that rewrites the draft, calls the safety_check tool,
+# and returns JSON constrained by the GovernedAndCheckedEmail response schema
 # Behavior:
 #   - Receives draft_email from CopyAgent (via state["draft_email"])
-#   - Applies creative_guidelines to ensure brand voice, tone, and style compliance
-#   - May modify subject lines or body text to align with brand standards
-#   - Outputs the "governed" version that meets all brand requirements
-#   - Stores result in state under "governed_email" key
-# Note: This agent could potentially use the brand_check FunctionTool for programmatic
-# rule enforcement, but currently relies on LLM for more nuanced brand alignment
-brand_agent = Agent(
-    name="BrandAgent",
-    model=Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config),
-    instruction="""
-You are a brand/style governance agent. You are given a draft email and you need to apply the creative guidelines to the draft email.
-Draft email: {draft_email}
-Creative guidelines: {creative_guidelines}
-Return the governed email.
-""",
-    output_key="governed_email",
-)
-
-# 3) Safety Agent — run safety_check tool
-# Design: Compliance and safety validation layer before deployment
-# Implementation: Combines LLM reasoning with programmatic safety_check_tool
-# Behavior:
-#   - Receives governed_email from BrandAgent (via state["governed_email"])
-#   - MUST call safety_check_tool (enforced by instruction) to perform automated checks:
+#   - Applies the creative guidelines to ensure brand voice, tone, and style compliance.
+#     Only the pre-summarized brand_rules_short is sent, not the full guidelines document
+#   - MUST call get_tools().safety_check (enforced by instruction) on the governed email:
 #     * Spam trigger detection (e.g., "free", "guaranteed", "urgent")
 #     * PII (Personally Identifiable Information) detection
-#     * Other compliance violations
-#   - LLM interprets tool results and generates a human-readable safety report
-#   - Stores report in state under "safety_report" key for human review
-# Critical: This agent MUST call the tool (not optional) to ensure automated safety checks
-# are always performed, providing a safety net even if LLM reasoning fails
-safety_agent = Agent(
-    name="SafetyAgent",
-    model=Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config),
+#   - Returns {"governed_email": ..., "safety_report": ...} as schema-validated JSON,
+#     stored in state under "governed_and_checked"
+#   - after_agent_callback unpacks the result into the governed_email and safety_report
+#     state keys, replacing the LLM-based packaging stage with a deterministic parse.
+#     It also re-runs safety_check on the final governed_email: the rewrite can add
+#     spam triggers, PII or disclaimer text after the tool call, so the relayed report
+#     is not trusted on its own
+governed_and_checked_agent = Agent(
+    name="GovernedAndCheckedAgent",
+    model=gemini_model,
     instruction="""
-You are a compliance/safety agent.
-You MUST call the safety_check tool with:
-- email_content: {governed_email}
-
-Return the safety report.
+You are a brand/style governance and compliance agent.
+1. Apply the creative guidelines to the draft email to produce the governed email.
+Draft email: {draft_email}
+Creative guidelines:
+{brand_rules_short}
+2. You MUST call the safety_check tool with the governed email.
+3. Return the governed email and the safety report exactly as returned by the tool.
 """,
-    tools=[safety_check_tool],
-    output_key="safety_report",
+    tools=[get_tools().safety_check],
+    output_schema=GovernedAndCheckedEmail,
+    output_key="governed_and_checked",
+    after_agent_callback=_unpack_governed_and_checked,
 )
 
-# 4) Packaging Agent — combines outputs into final format
-# Design: Final stage that aggregates all pipeline outputs into a single deliverable
-# Implementation: Uses LLM to structure the final output in a consistent JSON format
-# Behavior:
-#   - Receives both governed_email and safety_report from previous agents
-#   - Combines them into a single JSON object for easy consumption
-#   - Ensures consistent output format for the root agent and human reviewers
-#   - No output_key specified, so output goes to the SequentialAgent's final result
-packaging_agent = Agent(
-    name="PackagingAgent",
-    model=Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config),
-    instruction="""
-You are a packaging agent.
-You need to package the governed_email and the safety_report into a JSON object.
-Return the packaged JSON object.
-""",
-)
+# Pipeline Result Cache
+# Design: Re-running the pipeline on an unchanged brief + guidelines (e.g. after a
+# human rejection) would regenerate the same output through every LLM call
+# Implementation: Content-hash keyed SQLite cache (see basic/cache.py); the model name
+# is part of the key so switching models never serves stale results
+_lookup_cached_email, _store_cached_email = cached_pipeline_callbacks(gemini_model.model)
 
 # Sequential Agent Pipeline
 # Design: Orchestrates the execution of specialized agents in a defined sequence
 # Implementation: Uses SequentialAgent to chain agents together, passing state between them
 # Behavior:
-#   1. Executes before_agent_callback (_load_precreated_brief) before any agent runs
-#      - This loads campaign_brief and creative_guidelines into session state
-#   2. Runs copy_agent → brand_agent → safety_agent → packaging_agent in sequence
+#   1. Executes before_agent_callbacks before any agent runs
+#      - _load_precreated_brief loads campaign_brief, creative_guidelines and
+#        brand_rules_short into session state
+#      - _lookup_cached_email returns the cached packaged result on a hit, which
+#        skips the agents below entirely
+#   2. Runs copy_agent → governed_and_checked_agent in sequence
 #   3. Each agent's output (via output_key) becomes available to subsequent agents
-#   4. Final output from packaging_agent is returned as the pipeline result
+#   4. Final JSON output from governed_and_checked_agent is returned as the pipeline result
+#   5. Executes after_agent_callbacks once all agents have finished
+#      - _package_email assembles the packaged deliverable in Python (no packaging LLM call)
+#      - _store_cached_email stores it for future runs with the same inputs
 # State Flow:
-#   - Initial: campaign_brief, creative_guidelines (from callback)
+#   - Initial: campaign_brief, creative_guidelines, brand_rules_short (from callback)
 #   - After copy_agent: draft_email
-#   - After brand_agent: governed_email
-#   - After safety_agent: safety_report
-#   - After packaging_agent: final packaged JSON
+#   - After governed_and_checked_agent: governed_and_checked, governed_email, safety_report
+#   - After pipeline callback: packaged
 initial_email_creator_agent = SequentialAgent(
     name="EmailPipeline",
-    sub_agents=[copy_agent, brand_agent, safety_agent, packaging_agent],
-    # Callback executed once before the first agent runs
-    # Ensures all agents have access to initial campaign data
-    before_agent_callback=_load_precreated_brief
-    
+    sub_agents=[copy_agent, governed_and_checked_agent],
+    # Callbacks executed once before the first agent runs, in order
+    # Ensures all agents have access to initial campaign data, then checks the cache
+    before_agent_callback=[_load_precreated_brief, _lookup_cached_email],
+    # Callbacks executed once after the last agent finishes, in order
+    # Deterministically packages governed_email + safety_report into state["packaged"],
+    # then caches it
+    after_agent_callback=[_package_email, _store_cached_email],
 )
 
-
-
-print("✅ Agents defined: Copy, Brand, Safety, Packaging")
\ No newline at end of file
+logger.debug("Agents defined: Copy, GovernedAndChecked")
@@ -14,17 +14,157 @@ Tools:
     - brand_check: Programmatic brand compliance filtering
     - safety_check: Automated safety and compliance validation
     - reject_email_tool: Human rejection handler
-    - deploy_email_to_sfmc_tool: SFMC deployment integration (mock)
+    - deploy_email_to_sfmc: SFMC deployment integration (mock)
+    - enqueue_sfmc_deploy: Non-blocking SFMC deployment returning a correlation id
+    - check_sfmc_deploy_status: Polls the status of an enqueued deployment
+
+The FunctionTool wrappers for these are obtained from get_tools().
 """
 
 # Standard library imports
-import json
+import asyncio
+import logging
+import os
 import re
-import uuid
+from collections import OrderedDict
+from functools import cache, lru_cache
+from types import SimpleNamespace
 
 # Third-party imports
 from google.adk.tools.function_tool import FunctionTool
 
+logger = logging.getLogger(__name__)
+
+# Spam trigger words flagged by safety_check (common spam indicators)
+# Implementation: Module-level frozenset, so safety_check does not rebuild the set on
+# every call; also the single source for the alternation in _SPAM_RE below
+SPAM_TRIGGERS = frozenset(("free", "guaranteed", "urgent"))
+
+# Spam trigger pattern used by safety_check
+# Implementation: Compiled once at import; one alternation finds every trigger in a
+# single pass. IGNORECASE makes matching case-insensitive without building lowercased
+# copies of the text. Matches substrings (e.g. "free" in "freedom"), like the original
+# substring check. Kept separate from _PII_RE so a trigger inside an email address
+# (e.g. "urgent-help@acme.com") is still reported as a spam hit
+_SPAM_RE = re.compile("|".join(map(re.escape, sorted(SPAM_TRIGGERS))), re.IGNORECASE)
+
+# PII pattern used by safety_check
+# Implementation: Compiled once at import; only search() is used, stopping at the first hit
+#   - email: \b[\w.\-]+@[\w.\-]+\.\w+\b (word chars, dots, hyphens @ a domain with at
+#     least one dot). The \b anchors keep a match from starting mid-word, which prunes
+#     the candidate start positions the engine has to try and backtrack from
+#   - phone: \b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b (3-3-4 digit pattern with optional separators)
+_PII_RE = re.compile(
+    r"\b[\w.\-]+@[\w.\-]+\.\w+\b"
+    r"|\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b",
+)
+
+# Number of attempts the background deploy worker makes before marking a job failed
+SFMC_DEPLOY_ATTEMPTS = 3
+
+# Maximum number of deployments whose status is kept for check_sfmc_deploy_status
+SFMC_DEPLOY_REGISTRY_SIZE = 1000
+
+# In-process registry of enqueued SFMC deployments, keyed by pending_deploy_id
+# Design: Lets the root agent acknowledge the human immediately and poll later.
+# Implementation: OrderedDict updated via _record_sfmc_deploy, which keeps the most
+# recently updated entries last and drops the oldest beyond SFMC_DEPLOY_REGISTRY_SIZE,
+# so the registry does not grow for the life of the process
+# Note: Lives in process memory, so status is only visible to the instance that
+# enqueued the job; a shared queue (Cloud Tasks, Redis) would be needed across instances
+_SFMC_DEPLOYS: OrderedDict[str, dict] = OrderedDict()
+
+# Strong references to running deploy tasks so they are not garbage collected mid-run
+_SFMC_DEPLOY_TASKS: set[asyncio.Task] = set()
+
+# Deepest group nesting _trie_pattern emits before falling back to a flat alternation
+_TRIE_MAX_NESTING = 100
+
+def _trie_pattern(phrases) -> str:
+    """
+    Builds a regex matching any of the given phrases, with shared prefixes factored out.
+    
+    Design: A flat "a|b|c" alternation makes the regex engine retry every phrase at each
+    position in the text. Nesting the phrases as a character trie (e.g. "free|freebie|
+    fresh" becomes "fre(?:e|sh)") means each input character is compared against one
+    trie level instead of against every phrase, which is the same one-step-per-character
+    walk a literal-matching automaton performs, but stays inside the re module.
+    
+    Implementation: Only used with search() to test whether any phrase occurs, so a
+    phrase that extends a shorter phrase is redundant and its branch is dropped. The
+    trie is walked with an explicit stack and single-child chains become plain
+    literals, so long phrases cannot exhaust the Python recursion limit. Group nesting
+    grows with the number of branch points along a phrase, and re's own parser recurses
+    per group, so tries nested deeper than _TRIE_MAX_NESTING fall back to a flat
+    alternation.
+    
+    Args:
+        phrases: Collection of non-empty phrases (iterated more than once)
+    
+    Returns:
+        Regex source string (characters escaped)
+    """
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = None  # end-of-phrase marker
+    
+    # Pre-order walk; visiting it in reverse handles every child before its parent
+    order = []
+    stack = [trie]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        if "" not in node:
+            stack.extend(node.values())
+    
+    # id(node) -> (pattern, group nesting depth) of the subtree below node
+    emitted: dict = {}
+    for node in reversed(order):
+        if "" in node:
+            emitted[id(node)] = ("", 0)
+            continue
+        alts = [
+            (re.escape(ch) + emitted[id(child)][0], emitted[id(child)][1])
+            for ch, child in sorted(node.items())
+        ]
+        if len(alts) == 1:
+            emitted[id(node)] = alts[0]
+        else:
+            emitted[id(node)] = ("(?:" + "|".join(a for a, _ in alts) + ")", 1 + max(d for _, d in alts))
+    
+    pattern, nesting = emitted[id(trie)]
+    if nesting > _TRIE_MAX_NESTING:
+        return "|".join(re.escape(phrase) for phrase in sorted(set(phrases)))
+    return pattern
+
+@lru_cache(maxsize=32)
+def _compile_guidelines(banned_phrases: tuple, limit, disclaimer):
+    """
+    Builds the guideline-dependent artifacts used by brand_check.
+    
+    Design: The same creative guidelines are typically applied to many drafts, so the
+    banned-phrase regex, the integer length limit and the disclaimer suffix are built
+    once per unique guideline set and reused from the cache afterwards. Lowercasing and
+    deduplicating the phrases happens here too, so it is paid once per guideline set
+    rather than on every brand_check call.
+    
+    Args:
+        banned_phrases: Tuple of banned phrases exactly as given in the guidelines
+        limit: Subject length limit as given in the guidelines
+        disclaimer: Disclaimer text, or None
+    
+    Returns:
+        (banned_pat, limit, suffix) where banned_pat is the compiled case-insensitive
+        prefix-factored alternation (None if nothing is banned), limit is an int, and suffix is the
+        formatted disclaimer to append to bodies ("" if there is no disclaimer)
+    """
+    banned = {b.lower() for b in banned_phrases if b}
+    banned_pat = re.compile(_trie_pattern(banned), re.IGNORECASE) if banned else None
+    suffix = "\n\n*" + disclaimer + "*" if disclaimer else ""
+    return banned_pat, int(limit), suffix
 
 def brand_check(draft_email: dict, creative_guidelines: dict) -> dict:
     """
@@ -34,13 +174,17 @@ def brand_check(draft_email: dict, creative_guidelines: dict) -> dict:
     This ensures critical brand rules are always enforced, even if LLM misses them.
     
     Implementation Details:
-        - Case-insensitive banned phrase detection using set lookup (O(1) per phrase)
+        - Case-insensitive banned phrase detection using one compiled, prefix-factored
+          alternation regex, so each subject is scanned once regardless of how many
+          phrases are banned
+        - Guideline-derived artifacts (regex, limit, disclaimer suffix) are cached per
+          unique guideline set by _compile_guidelines
         - Subject line length truncation with rstrip to preserve formatting
         - Disclaimer appending to all body variants for legal compliance
         - Preserves original structure while filtering/transforming content
     
     Behavior:
-        1. Extracts banned phrases from creative_guidelines and normalizes to lowercase
+        1. Looks up the compiled banned-phrase pattern for creative_guidelines
         2. Filters subject lines:
            - Removes any subject containing banned phrases (case-insensitive)
            - Truncates remaining subjects to length limit
@@ -70,36 +214,64 @@ def brand_check(draft_email: dict, creative_guidelines: dict) -> dict:
     Note: Currently not directly used by BrandAgent (which uses LLM), but available
     for programmatic enforcement if needed. Could be integrated for hybrid approach.
     """
-    # Normalize banned phrases to lowercase set for O(1) lookup performance
-    # Uses set comprehension for efficient membership testing
-    banned = {b.lower() for b in (creative_guidelines.get("banned_phrases") or [])}
-    # Get subject length limit with default fallback to 60 characters
-    limit = int(creative_guidelines.get("subject_length_limit", 60))
+    # Look up the compiled banned-phrase alternation, the subject length limit (default
+    # fallback to 60 characters) and the disclaimer suffix for this guideline set
+    banned_pat, limit, suffix = _compile_guidelines(
+        tuple(creative_guidelines.get("banned_phrases") or ()),
+        creative_guidelines.get("subject_length_limit", 60),
+        creative_guidelines.get("disclaimer"),
+    )
     
     # Filter & trim subjects
-    # Implementation: Iterates through subjects, filtering banned phrases and applying length limit
-    filtered_subjects = []
-    for s in draft_email.get("subject_lines", []):
-        # Case-insensitive banned phrase detection
-        # Uses any() for short-circuit evaluation (stops at first match)
-        if any(b in s.lower() for b in banned): 
-            continue  # Skip this subject line entirely if it contains banned phrase
-        # Truncate to limit and remove trailing whitespace
-        s = s[:limit].rstrip()
-        filtered_subjects.append(s)
+    # Implementation: Two list comprehensions instead of an explicit loop with appends
+    subjects = draft_email.get("subject_lines", [])
+    if banned_pat is not None:
+        # Case-insensitive banned phrase detection; drop any subject containing one
+        # search() stops at the first banned phrase found
+        search = banned_pat.search
+        subjects = [s for s in subjects if not search(s)]
+    # Truncate to limit and remove trailing whitespace
+    filtered_subjects = [s[:limit].rstrip() for s in subjects]
     
     # Append disclaimer to bodies
-    # Implementation: Creates a copy of body list to avoid mutating original
+    # Implementation: No defensive copy; the comprehension below builds a new list, and the
+    # list is only serialized afterwards, never mutated
     # Appends disclaimer as italicized text at the end of each body variant
-    bodies = draft_email.get("body_variants", [])[:]  # [:] creates shallow copy
-    disclaimer = creative_guidelines.get("disclaimer")
-    if disclaimer:
-        # List comprehension to append disclaimer to all body variants
+    bodies = draft_email.get("body_variants") or []
+    if suffix:
+        # List comprehension to append the precomputed disclaimer suffix to all body variants
         # Format: adds two newlines and italicized disclaimer
-        bodies = [b + f"\n\n*{disclaimer}*" for b in bodies]
+        bodies = [b + suffix for b in bodies]
     
     return {"subject_lines": filtered_subjects, "body_variants": bodies}
 
+def _iter_strings(obj):
+    """
+    Recursively yields the scannable text of a JSON-like structure.
+    
+    Implementation: Walks dict keys and values and list/tuple items. Numeric scalars are
+    yielded as str() so a phone number stored as an int is still seen by the PII check;
+    bools and None carry no text and are skipped. Keys are yielded too, so a trigger
+    word in a key (e.g. "free_shipping") is flagged as it was in the serialized scan.
+    
+    Args:
+        obj: A str, number, dict, list or tuple (arbitrarily nested)
+    
+    Yields:
+        Each string (or stringified number) found in obj
+    """
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            yield from _iter_strings(key)
+            yield from _iter_strings(value)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            yield from _iter_strings(item)
+    elif isinstance(obj, (int, float)) and not isinstance(obj, bool):
+        yield str(obj)
+
 def safety_check(governed_email: dict) -> dict:
     """
     Automated safety and compliance validation for email content.
@@ -108,16 +280,19 @@ def safety_check(governed_email: dict) -> dict:
     This ensures critical safety rules are always enforced programmatically.
     
     Implementation Details:
-        - Converts entire email structure to JSON string for comprehensive text search
-        - Uses case-insensitive matching by converting to lowercase
-        - Spam detection via keyword matching against known trigger words
-        - PII detection via regex patterns for emails and phone numbers
+        - Walks the email structure and scans each key, string value and number (no
+          JSON serialization, so quotes and braces are never scanned)
+        - Uses case-insensitive matching via re.IGNORECASE (no lowercased copy)
+        - Spam triggers (_SPAM_RE) and PII (_PII_RE) are matched independently, so a
+          trigger inside an email address is still reported as a spam hit
+        - A check is skipped for the remaining values once it is decided (every trigger
+          found / PII found), and the report is returned as soon as both are
         - Returns structured report with boolean flags and detected issues
     
     Behavior:
-        1. Serializes governed_email to JSON string for text analysis
+        1. Iterates over the keys, string values and numbers of governed_email
         2. Checks for spam trigger words (case-insensitive):
-           - "free", "guaranteed", "urgent" (common spam indicators)
+           - SPAM_TRIGGERS: "free", "guaranteed", "urgent" (common spam indicators)
         3. Detects PII using regex patterns:
            - Email addresses: word@word.domain format
            - Phone numbers: 10-digit patterns with various separators
@@ -126,7 +301,8 @@ def safety_check(governed_email: dict) -> dict:
     
     Args:
         governed_email: Dictionary containing the email content to check.
-                       Structure can vary, but will be serialized to JSON for analysis.
+                       Structure can vary; every nested key, string and number
+                       is checked.
     
     Returns:
         Dictionary with safety validation results:
@@ -142,24 +318,24 @@ def safety_check(governed_email: dict) -> dict:
         - Add content moderation for inappropriate language
         - Integrate with external compliance APIs
     """
-    # Serialize email to JSON string for comprehensive text search
-    # Lowercase conversion enables case-insensitive matching
-    text = json.dumps(governed_email).lower()
-    
-    # Spam trigger word detection
-    # Design: Uses set of known spam indicators commonly flagged by email filters
-    # Implementation: Set membership testing for O(1) lookup performance
-    spam_triggers = {"free","guaranteed","urgent"}
-    # List comprehension to collect all detected trigger words
-    spam_hits = [w for w in spam_triggers if w in text]
-    
-    # PII (Personally Identifiable Information) detection
-    # Implementation: Uses regex to find email addresses and phone numbers
-    # Pattern breakdown:
-    #   - Email: [\w\.-]+@[\w\.-]+ (word chars, dots, hyphens @ word chars, dots, hyphens)
-    #   - Phone: \b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b (3-3-4 digit pattern with optional separators)
-    # Note: Regex pattern has escaped backslashes for Python string literal
-    pii = bool(re.search(r"[\\w\\.-]+@[\\w\\.-]+|\\b\\d{3}[-.\\s]?\\d{3}[-.\\s]?\\d{4}\\b", text))
+    # Spam trigger word and PII (Personally Identifiable Information) detection
+    # Design: Uses the set of known spam indicators commonly flagged by email filters
+    # (SPAM_TRIGGERS)
+    # Implementation: Per scanned string, one finditer pass collects spam hits into a set
+    # (deduplicated across values) and one search() decides PII. Each check is skipped
+    # once it is decided, and the report is returned as soon as both are
+    spam_hits = set()
+    pii = False
+    for text in _iter_strings(governed_email):
+        if len(spam_hits) < len(SPAM_TRIGGERS):
+            spam_hits.update(m.group().lower() for m in _SPAM_RE.finditer(text))
+        if not pii:
+            pii = _PII_RE.search(text) is not None
+        # Nothing left to find once every trigger and PII have been seen; the report
+        # is fully determined, so return it without scanning further
+        if pii and len(spam_hits) == len(SPAM_TRIGGERS):
+            return {"safe": False, "spam_hits": sorted(SPAM_TRIGGERS), "pii_detected": True}
+    spam_hits = sorted(spam_hits)
     
     # Overall safety determination
     # Safe only if: no spam triggers detected AND no PII detected
@@ -178,7 +354,8 @@ def reject_email_tool() -> str:
     
     Behavior:
         - Returns confirmation message that email was rejected
-        - Root agent uses this to acknowledge human decision
+        - Called by basic.approvals once a rejection has been claimed (which also
+          evicts the rejected email from the pipeline cache)
         - Could be extended to log rejection reason, timestamp, etc.
     
     Returns:
@@ -187,7 +364,7 @@ def reject_email_tool() -> str:
     return "Email rejected by human approval."
 
 
-def deploy_email_to_sfmc_tool(governed_email: dict) -> dict:
+def deploy_email_to_sfmc(governed_email: dict) -> dict:
     """
     Deploys approved email to Salesforce Marketing Cloud (SFMC).
     
@@ -195,7 +372,7 @@ def deploy_email_to_sfmc_tool(governed_email: dict) -> dict:
     Currently implemented as a mock for development/demo purposes.
     
     Implementation (Mock):
-        - Generates a mock SFMC ID using UUID
+        - Generates a random mock SFMC ID
         - Returns a simulated deployment response
         - Does not perform actual API call
     
@@ -231,10 +408,11 @@ def deploy_email_to_sfmc_tool(governed_email: dict) -> dict:
         - Webhook callbacks for async deployment status
         - Rollback capability for failed deployments
     """
-    # Generate mock SFMC ID using UUID
-    # Implementation: Uses UUID4 for randomness, takes first 8 hex chars for shorter ID
+    # Generate mock SFMC ID
+    # Implementation: 4 random bytes hex-encode to exactly 8 chars, so no UUID is built
+    # only to discard 24 of its 32 hex chars
     # Format: "sfmc_" prefix + 8-character hex string (e.g., "sfmc_a1b2c3d4")
-    sfmc_id = f"sfmc_{uuid.uuid4().hex[:8]}"
+    sfmc_id = "sfmc_" + os.urandom(4).hex()
     
     return {
         "sfmc_id": sfmc_id,
@@ -243,21 +421,134 @@ def deploy_email_to_sfmc_tool(governed_email: dict) -> dict:
     }
 
 
+def _record_sfmc_deploy(pending_deploy_id: str, entry: dict) -> None:
+    """
+    Stores the latest status of a deployment in the bounded registry.
+    
+    Implementation: The entry is moved to the end (most recently updated), then the
+    oldest entries are dropped until at most SFMC_DEPLOY_REGISTRY_SIZE remain; a dropped
+    id is reported as "unknown" by check_sfmc_deploy_status.
+    
+    Args:
+        pending_deploy_id: Correlation id returned by enqueue_sfmc_deploy
+        entry: Status dictionary to store
+    """
+    _SFMC_DEPLOYS[pending_deploy_id] = entry
+    _SFMC_DEPLOYS.move_to_end(pending_deploy_id)
+    while len(_SFMC_DEPLOYS) > SFMC_DEPLOY_REGISTRY_SIZE:
+        _SFMC_DEPLOYS.popitem(last=False)
+
+
+async def _run_sfmc_deploy(pending_deploy_id: str, governed_email: dict) -> None:
+    """
+    Background worker that performs an enqueued SFMC deployment.
+    
+    Implementation: Runs the blocking deploy_email_to_sfmc call in a worker thread so
+    the event loop stays free, retrying with exponential backoff (1s, 2s, ...) before
+    recording the job as failed.
+    
+    Args:
+        pending_deploy_id: Correlation id returned by enqueue_sfmc_deploy
+        governed_email: The approved email content to deploy
+    """
+    for attempt in range(SFMC_DEPLOY_ATTEMPTS):
+        try:
+            result = await asyncio.to_thread(deploy_email_to_sfmc, governed_email)
+        except Exception as e:
+            logger.warning("SFMC deploy %s attempt %d failed: %s", pending_deploy_id, attempt + 1, e)
+            if attempt + 1 < SFMC_DEPLOY_ATTEMPTS:
+                await asyncio.sleep(2 ** attempt)
+            continue
+        _record_sfmc_deploy(pending_deploy_id, {"pending_deploy_id": pending_deploy_id, **result})
+        return
+    _record_sfmc_deploy(pending_deploy_id, {
+        "pending_deploy_id": pending_deploy_id,
+        "status": "failed",
+        "note": f"SFMC deployment failed after {SFMC_DEPLOY_ATTEMPTS} attempts.",
+    })
+
+
+async def enqueue_sfmc_deploy(governed_email: dict) -> dict:
+    """
+    Enqueues an approved email for deployment to SFMC without waiting for it.
+    
+    Design: SFMC deployments can take seconds to minutes. Rather than holding the root
+    agent's turn open for the whole call, the deployment runs as a background task and
+    the agent gets a correlation id back immediately.
+    
+    Behavior:
+        1. Registers the job as "pending" under a new pending_deploy_id
+        2. Starts the background worker (_run_sfmc_deploy) on the event loop
+        3. Returns right away; use check_sfmc_deploy_status to follow up
+    
+    Args:
+        governed_email: Dictionary containing the final, approved email content
+    
+    Returns:
+        Dictionary with the correlation id:
+        {
+            "pending_deploy_id": str,        # Id to pass to check_sfmc_deploy_status
+            "status": "pending",
+            "requires_confirmation": False   # No further human input is needed
+        }
+    """
+    pending_deploy_id = "deploy_" + os.urandom(4).hex()
+    _record_sfmc_deploy(pending_deploy_id, {"pending_deploy_id": pending_deploy_id, "status": "pending"})
+    task = asyncio.create_task(_run_sfmc_deploy(pending_deploy_id, governed_email))
+    _SFMC_DEPLOY_TASKS.add(task)
+    task.add_done_callback(_SFMC_DEPLOY_TASKS.discard)
+    return {"pending_deploy_id": pending_deploy_id, "status": "pending", "requires_confirmation": False}
+
+
+def check_sfmc_deploy_status(pending_deploy_id: str) -> dict:
+    """
+    Returns the current status of an enqueued SFMC deployment.
+    
+    Args:
+        pending_deploy_id: Correlation id returned by enqueue_sfmc_deploy
+    
+    Returns:
+        Dictionary with "status" ("pending", "queued" once SFMC accepted it, "failed",
+        or "unknown" for an unrecognized or expired id) plus sfmc_id and note when available
+    """
+    return _SFMC_DEPLOYS.get(
+        pending_deploy_id,
+        {"pending_deploy_id": pending_deploy_id, "status": "unknown", "note": "No such deployment."},
+    )
+
+
 
 # Function Tool Wrappers
 # Design: Wraps Python functions as callable tools that agents can invoke
-# Implementation: FunctionTool automatically generates tool schemas from function signatures
+# Implementation: FunctionTool automatically generates tool schemas from function signatures.
+# get_tools() is the single place the wrappers are built; it is cached, so every agent
+# shares one instance per tool. The agent modules call it at import, so the wrappers exist
+# as soon as basic.agent is loaded; importing only the plain functions from this module
+# (as the approval endpoint does) builds none
 # Behavior: Agents can call these tools by name, passing arguments and receiving return values
 #
-# Tool Registration:
-#   - brand_check_tool: Available for programmatic brand filtering (currently unused)
-#   - safety_check_tool: Used by SafetyAgent for automated compliance checks
-#   - reject_email_tool: Used by RootAgent when human rejects email
-#   - deploy_email_to_sfmc_tool: Used by RootAgent when human approves email
-
-brand_check_tool = FunctionTool(brand_check)
-safety_check_tool = FunctionTool(safety_check)
-reject_email_tool = FunctionTool(reject_email_tool)
-deploy_email_to_sfmc_tool = FunctionTool(deploy_email_to_sfmc_tool)
-
-print("✅ FunctionTools ready: brand_check, safety_check, assemble_payload")
\ No newline at end of file
+# Tool Registration (attributes of get_tools()):
+#   - brand_check: Available for programmatic brand filtering (currently unused)
+#   - safety_check: Used by GovernedAndCheckedAgent for automated compliance checks
+#   - deploy_email_to_sfmc: Synchronous SFMC deployment (blocks until SFMC responds)
+#   - enqueue_sfmc_deploy: Standalone non-blocking deploy (approve_email in
+#     basic.approvals calls enqueue_sfmc_deploy directly)
+#   - check_sfmc_deploy_status: Used by RootAgent to follow up on a deployment
+@cache
+def get_tools() -> SimpleNamespace:
+    """
+    Returns the FunctionTool wrappers for this module, building them on first call.
+    
+    Returns:
+        Namespace with one FunctionTool per tool function (see Tool Registration above);
+        the same instances are returned on every call
+    """
+    tools = SimpleNamespace(
+        brand_check=FunctionTool(brand_check),
+        safety_check=FunctionTool(safety_check),
+        deploy_email_to_sfmc=FunctionTool(deploy_email_to_sfmc),
+        enqueue_sfmc_deploy=FunctionTool(enqueue_sfmc_deploy),
+        check_sfmc_deploy_status=FunctionTool(check_sfmc_deploy_status),
+    )
+    logger.debug("FunctionTools ready: %s", ", ".join(vars(tools)))
+    return tools
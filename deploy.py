@@ -110,7 +110,8 @@ def deploy_agent(project_id: str, region: str, agent_name: str = None):
         requirements = []
         if requirements_path.exists():
             with open(requirements_path, "r") as f:
-                requirements = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+                # Strip each line once; skip blank lines and comments (including indented ones)
+                requirements = [s for s in (line.strip() for line in f) if s and not s.startswith("#")]
         
         # Deploy
         remote_agent = agent_engines.create(
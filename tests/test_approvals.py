@@ -0,0 +1,130 @@
+"""Tests for the asynchronous approval hand-off (basic/approvals.py)."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from basic import approvals, cache, tools
+
+EMAIL = {
+    "subject_lines": ["Fresh savings <this week>"],
+    "body_variants": ["Save on produce.\n\n*Prices may vary by store.*"],
+}
+SAFE_REPORT = {"safe": True, "spam_hits": [], "pii_detected": False}
+UNSAFE_REPORT = {"safe": False, "spam_hits": ["free"], "pii_detected": True}
+
+
+@pytest.fixture(autouse=True)
+def isolated_stores(tmp_path, monkeypatch):
+    monkeypatch.setattr(approvals, "APPROVALS_DB_PATH", str(tmp_path / "approvals.sqlite3"))
+    monkeypatch.setattr(approvals, "APPROVAL_WEBHOOK_URL", None)
+    monkeypatch.setattr(cache, "CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+
+
+def _tool_context(**state):
+    return SimpleNamespace(state=state, session=SimpleNamespace(id="session-1"))
+
+
+def _request(report=SAFE_REPORT, **state):
+    context = _tool_context(governed_email=EMAIL, safety_report=report, **state)
+    return asyncio.run(approvals.request_human_approval(context))
+
+
+def _status(approval_id):
+    return approvals._load_snapshot(approval_id)["status"]
+
+
+def test_request_without_pipeline_output_is_an_error():
+    result = asyncio.run(approvals.request_human_approval(_tool_context()))
+    assert result["status"] == "error"
+
+
+def test_request_snapshots_session_state():
+    handle = _request(**{cache.CACHE_KEY_STATE: "key-1"})
+    snapshot = approvals._load_snapshot(handle["approval_id"])
+    assert snapshot["governed_email"] == EMAIL
+    assert snapshot["safety_report"] == SAFE_REPORT
+    assert snapshot["cache_key"] == "key-1"
+    assert snapshot["session_id"] == "session-1"
+    assert snapshot["status"] == "pending"
+    assert handle["requires_confirmation"] is True
+    assert handle["approve_url"].endswith("/approve/" + handle["approval_id"])
+
+
+def test_approval_ids_are_long_random_tokens():
+    first, second = _request()["approval_id"], _request()["approval_id"]
+    assert first != second
+    assert len(first) >= len("appr_") + 22  # token_urlsafe(16) encodes 128 bits
+
+
+def test_confirmation_page_shows_email_and_does_not_decide():
+    approval_id = _request(report=UNSAFE_REPORT)["approval_id"]
+    page = asyncio.run(approvals.confirm_approve(approval_id)).body.decode()
+    assert "Fresh savings &lt;this week&gt;" in page
+    assert "Prices may vary by store." in page
+    assert "WARNING" in page and "PII detected" in page and "free" in page
+    assert 'method="post"' in page
+    assert _status(approval_id) == "pending"
+
+
+def test_confirmation_page_for_safe_email_has_no_warning():
+    approval_id = _request()["approval_id"]
+    page = asyncio.run(approvals.confirm_reject(approval_id)).body.decode()
+    assert "WARNING" not in page
+
+
+def test_unknown_approval_id_is_404():
+    for handler in (approvals.confirm_approve, approvals.approve, approvals.reject):
+        with pytest.raises(HTTPException) as excinfo:
+            asyncio.run(handler("appr_missing"))
+        assert excinfo.value.status_code == 404
+
+
+def test_link_approval_enqueues_deploy():
+    approval_id = _request()["approval_id"]
+
+    async def approve_and_wait():
+        result = await approvals.approve(approval_id)
+        await asyncio.gather(*tools._SFMC_DEPLOY_TASKS)
+        return result
+
+    result = asyncio.run(approve_and_wait())
+    assert result["status"] == "approved"
+    assert _status(approval_id) == "approved"
+    assert tools.check_sfmc_deploy_status(result["pending_deploy_id"])["status"] == "queued"
+
+
+def test_each_approval_is_decided_once_across_paths():
+    approval_id = _request()["approval_id"]
+    assert asyncio.run(approvals.reject(approval_id))["status"] == "rejected"
+
+    assert asyncio.run(approvals.approve_email(approval_id))["status"] == "error"
+    for handler in (approvals.approve, approvals.reject, approvals.confirm_approve):
+        with pytest.raises(HTTPException) as excinfo:
+            asyncio.run(handler(approval_id))
+        assert excinfo.value.status_code == 409
+    assert _status(approval_id) == "rejected"
+
+
+def test_chat_approval_blocks_link_decision():
+    approval_id = _request()["approval_id"]
+
+    async def approve_and_wait():
+        result = await approvals.approve_email(approval_id)
+        await asyncio.gather(*tools._SFMC_DEPLOY_TASKS)
+        return result
+
+    assert asyncio.run(approve_and_wait())["status"] == "approved"
+    assert asyncio.run(approvals.reject_email_via_approval(approval_id))["status"] == "error"
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(approvals.approve(approval_id))
+    assert excinfo.value.status_code == 409
+
+
+def test_rejection_evicts_cached_pipeline_result():
+    cache.put_cached("key-1", {"governed_email": EMAIL, "safety_report": SAFE_REPORT})
+    approval_id = _request(**{cache.CACHE_KEY_STATE: "key-1"})["approval_id"]
+    assert asyncio.run(approvals.reject_email_via_approval(approval_id))["status"] == "rejected"
+    assert cache.get_cached("key-1") is None
@@ -0,0 +1,59 @@
+"""Tests for brand_check and its prefix-factored banned-phrase regex (basic/tools.py)."""
+
+import random
+import re
+
+from basic.tools import _TRIE_MAX_NESTING, _trie_pattern, brand_check
+
+
+def _flat_pattern(phrases):
+    return "|".join(re.escape(p) for p in sorted(phrases))
+
+
+def test_trie_matches_flat_alternation_on_random_texts():
+    rng = random.Random(42)
+    alphabet = "abc. "
+    for _ in range(300):
+        phrases = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5)))
+                   for _ in range(rng.randint(1, 8))}
+        trie = re.compile(_trie_pattern(phrases))
+        flat = re.compile(_flat_pattern(phrases))
+        for _ in range(20):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            assert bool(trie.search(text)) == bool(flat.search(text)), (phrases, text)
+
+
+def test_trie_escapes_regex_metacharacters():
+    pattern = re.compile(_trie_pattern({"50% off!", "a.b", "(new)"}))
+    assert pattern.search("get (new) items")
+    assert not pattern.search("axb")
+
+
+def test_long_phrase_does_not_hit_recursion_limit():
+    pattern = re.compile(_trie_pattern({"a" * 1200}))
+    assert pattern.search("x" + "a" * 1200)
+    assert not pattern.search("a" * 1199)
+
+
+def test_deeply_nested_trie_falls_back_to_flat_alternation():
+    phrases = ["a" * i + "b" for i in range(_TRIE_MAX_NESTING * 2)]
+    source = _trie_pattern(phrases)
+    assert source == _flat_pattern(phrases)
+    assert re.compile(source).search("aaab")
+
+
+def test_brand_check_filters_truncates_and_appends_disclaimer():
+    draft = {
+        "subject_lines": ["URGENT: deals inside", "Fresh savings for the whole family   this week"],
+        "body_variants": ["Body one", "Body two"],
+    }
+    guidelines = {"banned_phrases": ["urgent"], "subject_length_limit": 28, "disclaimer": "Prices vary."}
+    assert brand_check(draft, guidelines) == {
+        "subject_lines": ["Fresh savings for the whole"],
+        "body_variants": ["Body one\n\n*Prices vary.*", "Body two\n\n*Prices vary.*"],
+    }
+
+
+def test_brand_check_without_rules_keeps_content():
+    draft = {"subject_lines": ["Hello"], "body_variants": ["Body"]}
+    assert brand_check(draft, {}) == draft
@@ -0,0 +1,92 @@
+"""Tests for the pipeline result cache (basic/cache.py)."""
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from google.genai import types
+
+from basic import cache
+
+BRIEF = {"brand": "HEB", "offer": {"details": "15% off"}}
+GUIDELINES = {"tone": "Friendly", "banned_phrases": ["urgent"]}
+PACKAGED = {
+    "governed_email": {"subject_lines": ["Hi"], "body_variants": ["Body"]},
+    "safety_report": {"safe": True, "spam_hits": [], "pii_detected": False},
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+
+
+def _callback_context(request):
+    user_content = types.Content(role="user", parts=[types.Part(text=request)])
+    state = {"campaign_brief": BRIEF, "creative_guidelines": GUIDELINES}
+    return SimpleNamespace(state=state, user_content=user_content)
+
+
+def test_cache_key_ignores_dict_order():
+    reordered = {"offer": {"details": "15% off"}, "brand": "HEB"}
+    assert cache.cache_key(BRIEF, GUIDELINES, "go", "m") == cache.cache_key(reordered, GUIDELINES, "go", "m")
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [
+        ({"brand": "Other"}, GUIDELINES, "go", "m"),
+        (BRIEF, {"tone": "Formal"}, "go", "m"),
+        (BRIEF, GUIDELINES, "make it shorter", "m"),
+        (BRIEF, GUIDELINES, "go", "other-model"),
+    ],
+)
+def test_cache_key_covers_every_input(changed):
+    assert cache.cache_key(*changed) != cache.cache_key(BRIEF, GUIDELINES, "go", "m")
+
+
+def test_put_get_evict_roundtrip():
+    assert cache.get_cached("k") is None
+    cache.put_cached("k", PACKAGED)
+    assert cache.get_cached("k") == PACKAGED
+    cache.evict_cached("k")
+    assert cache.get_cached("k") is None
+    cache.evict_cached("k")  # evicting a missing key is a no-op
+
+
+def test_callbacks_miss_store_then_hit():
+    lookup, store = cache.cached_pipeline_callbacks("m")
+
+    first = _callback_context("write the email")
+    assert asyncio.run(lookup(first)) is None
+    key = first.state[cache.CACHE_KEY_STATE]
+    first.state["packaged"] = PACKAGED
+    asyncio.run(store(first))
+    assert cache.get_cached(key) == PACKAGED
+
+    second = _callback_context("write the email")
+    content = asyncio.run(lookup(second))
+    assert orjson.loads(content.parts[0].text) == PACKAGED
+    assert second.state["packaged"] == PACKAGED
+    assert second.state["governed_email"] == PACKAGED["governed_email"]
+    assert second.state["safety_report"] == PACKAGED["safety_report"]
+
+
+def test_different_request_misses_the_cache():
+    lookup, store = cache.cached_pipeline_callbacks("m")
+    first = _callback_context("write the email")
+    asyncio.run(lookup(first))
+    first.state["packaged"] = PACKAGED
+    asyncio.run(store(first))
+
+    assert asyncio.run(lookup(_callback_context("make it shorter"))) is None
+
+
+def test_store_skips_incomplete_results():
+    lookup, store = cache.cached_pipeline_callbacks("m")
+    context = _callback_context("write the email")
+    asyncio.run(lookup(context))
+    context.state["packaged"] = {"governed_email": None, "safety_report": None}
+    asyncio.run(store(context))
+    assert cache.get_cached(context.state[cache.CACHE_KEY_STATE]) is None
@@ -0,0 +1,66 @@
+"""Tests for the session-state callbacks in basic/memory.py."""
+
+from types import SimpleNamespace
+
+import orjson
+
+from basic import memory
+from basic.tools import safety_check
+
+CLEAN_EMAIL = {"subject_lines": ["Fresh savings"], "body_variants": ["Shop produce today."]}
+UNSAFE_EMAIL = {"subject_lines": ["Free produce"], "body_variants": ["Reply to help@heb.com"]}
+
+
+def _callback_context(governed_email, safety_report):
+    result = {"governed_email": governed_email, "safety_report": safety_report}
+    return SimpleNamespace(state={"governed_and_checked": result})
+
+
+def test_matching_report_leaves_output_unchanged():
+    context = _callback_context(CLEAN_EMAIL, safety_check(CLEAN_EMAIL))
+    assert memory._unpack_governed_and_checked(context) is None
+    assert context.state["governed_email"] == CLEAN_EMAIL
+    assert context.state["safety_report"] == {"safe": True, "spam_hits": [], "pii_detected": False}
+
+
+def test_misreported_safety_is_corrected():
+    context = _callback_context(UNSAFE_EMAIL, {"safe": True, "spam_hits": [], "pii_detected": False})
+    content = memory._unpack_governed_and_checked(context)
+
+    expected = {"safe": False, "spam_hits": ["free"], "pii_detected": True}
+    assert orjson.loads(content.parts[0].text) == {"governed_email": UNSAFE_EMAIL, "safety_report": expected}
+    assert context.state["safety_report"] == expected
+    assert context.state["governed_and_checked"]["safety_report"] == expected
+
+
+def test_missing_governed_email_is_passed_through():
+    context = SimpleNamespace(state={})
+    assert memory._unpack_governed_and_checked(context) is None
+    assert context.state["governed_email"] is None
+    assert context.state["safety_report"] is None
+
+
+def test_guideline_summary_keeps_only_constraints():
+    guidelines = memory._INITIAL_STATE["creative_guidelines"]
+    summary = memory._summarize_guidelines(guidelines)
+
+    assert "- Brand: HEB" in summary
+    assert "- Subject lines: max 60 chars" in summary
+    assert "- Must include: unsubscribe_link, physical_address, company_name" in summary
+    assert f"- Disclaimer to append: {guidelines['disclaimers']['default']}" in summary
+    assert guidelines["disclaimers"]["discount"] not in summary
+    assert "recommended" not in summary
+    assert "governance_score_weights" not in summary
+    assert len(summary) < len(orjson.dumps(guidelines)) / 2
+
+
+def test_guideline_summary_accepts_flat_schema():
+    summary = memory._summarize_guidelines(
+        {"tone": "Friendly", "banned_phrases": ["urgent"], "subject_length_limit": 40, "disclaimer": "Terms apply."}
+    )
+    assert summary.splitlines() == [
+        "- Tone: Friendly",
+        "- Never use: urgent",
+        "- Subject lines: max 40 chars",
+        "- Disclaimer to append: Terms apply.",
+    ]
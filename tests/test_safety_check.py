@@ -0,0 +1,107 @@
+"""Tests for safety_check and its compiled patterns (basic/tools.py)."""
+
+import random
+import re
+
+import pytest
+
+from basic.tools import SPAM_TRIGGERS, safety_check
+
+# Reference PII patterns, applied independently of the compiled ones under test
+EMAIL_RE = re.compile(r"\b[\w.\-]+@[\w.\-]+\.\w+\b")
+PHONE_RE = re.compile(r"\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b")
+
+
+def _texts(obj):
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            yield key
+            yield from _texts(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from _texts(item)
+    elif isinstance(obj, str):
+        yield obj
+
+
+def reference_safety_check(email):
+    """Straightforward substring/regex check over every text, without early exits."""
+    texts = list(_texts(email))
+    spam_hits = sorted(w for w in SPAM_TRIGGERS if any(w in t.lower() for t in texts))
+    pii = any(EMAIL_RE.search(t) or PHONE_RE.search(t) for t in texts)
+    return {"safe": not spam_hits and not pii, "spam_hits": spam_hits, "pii_detected": pii}
+
+
+WORDS = ["free", "Guaranteed", "URGENT", "a@b.com", "x.y@z", "555-123-4567", "hello",
+         "freebie@x.com", "5551234567", " ", "@", ".", "-", "1", "x", "com"]
+
+
+def _random_email(rng):
+    def text(n):
+        return "".join(rng.choice(WORDS) for _ in range(rng.randint(0, n)))
+    return {
+        "subject_lines": [text(5) for _ in range(3)],
+        "body_variants": [text(8) for _ in range(2)],
+    }
+
+
+def test_matches_reference_on_random_emails():
+    rng = random.Random(1234)
+    for _ in range(3000):
+        email = _random_email(rng)
+        assert safety_check(email) == reference_safety_check(email), email
+
+
+def test_clean_email_is_safe():
+    email = {"subject_lines": ["Fresh savings this week"], "body_variants": ["Shop produce today."]}
+    assert safety_check(email) == {"safe": True, "spam_hits": [], "pii_detected": False}
+
+
+def test_spam_matching_is_case_insensitive():
+    assert safety_check({"a": "FREE delivery, Guaranteed"})["spam_hits"] == ["free", "guaranteed"]
+
+
+def test_spam_trigger_inside_email_address_is_reported():
+    assert safety_check({"a": "urgent-help@acme.com"}) == {
+        "safe": False,
+        "spam_hits": ["urgent"],
+        "pii_detected": True,
+    }
+
+
+def test_dict_keys_are_scanned():
+    assert safety_check({"free_shipping": True})["spam_hits"] == ["free"]
+
+
+def test_numeric_phone_number_is_pii():
+    assert safety_check({"contact": 5551234567})["pii_detected"] is True
+
+
+def test_booleans_are_not_scanned_as_numbers():
+    assert safety_check({"a": True, "b": [False, None]})["safe"] is True
+
+
+def test_early_exit_matches_full_scan():
+    email = {
+        "subject_lines": ["FREE, guaranteed and urgent: call 555-123-4567"],
+        "body_variants": ["more free text", "a@b.com"] * 50,
+    }
+    assert safety_check(email) == reference_safety_check(email) == {
+        "safe": False,
+        "spam_hits": sorted(SPAM_TRIGGERS),
+        "pii_detected": True,
+    }
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("write to user@host", False),
+        ("write to a@b.com", True),
+        ("Questions? Email help@acme.com.", True),
+        ("call 555.123.4567 today", True),
+        ("order 12345", False),
+    ],
+)
+def test_pii_patterns(text, expected):
+    assert safety_check({"a": text})["pii_detected"] is expected